@@ -1,15 +1,50 @@
 import sys
+import time
 from PyQt5.QtWidgets import (QApplication,QWidget,QPushButton,QVBoxLayout,QHBoxLayout,QLabel)
-from PyQt5.QtCore import QTimer,QTime,Qt
+from PyQt5.QtCore import QEvent,QTimer,Qt
+
+# Elapsed time is read from a monotonic clock, not counted in timer ticks, so late
+# or skipped ticks never lose time. Running time accumulates across start/stop.
+class elapsed_clock:
+    def __init__(self,now=time.monotonic_ns):
+        self.now=now
+        self.accumulated_ns=0
+        self.started_ns=None
+
+    def running(self):
+        return self.started_ns is not None
+
+    def start(self):
+        if not self.running():
+            self.started_ns=self.now()
+
+    def stop(self):
+        if self.running():
+            self.accumulated_ns+=self.now()-self.started_ns
+            self.started_ns=None
+
+    def reset(self):
+        self.accumulated_ns=0
+        if self.running():
+            self.started_ns=self.now()
+
+    def elapsed_ms(self):
+        elapsed=self.accumulated_ns
+        if self.running():
+            elapsed+=self.now()-self.started_ns
+        return elapsed//1_000_000
+
 class stopwatch(QWidget):
     def __init__(self):
         super().__init__()
-        self.time=QTime(0,0,0,0)
+        self.clock=elapsed_clock()
         self.time_label=QLabel("00:00:00:00",self)
         self.start_button=QPushButton("Start",self)
         self.stop_button=QPushButton("stop",self)
         self.reset_button=QPushButton("reset",self)
         self.timer=QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.shown_text=self.time_label.text()
         self.initUI()
     
     def initUI(self):
@@ -54,25 +89,60 @@ class stopwatch(QWidget):
 
 
     def start(self):
-        self.timer.start(10)
+        self.clock.start()
+        self.schedule()
 
     def stop(self):
-        self.timer.stop(10)
+        self.clock.stop()
+        self.schedule()
+        self.update_display()
+
+    def refresh_interval(self):
+        handle=self.windowHandle()
+        screen=handle.screen() if handle else QApplication.primaryScreen()
+        rate=screen.refreshRate() if screen else 0
+        return max(1,round(1000/(rate or 60)))
+
+    # Repaint at the display's refresh rate only while running and on screen; a hidden
+    # or minimized window doesn't tick at all, the clock keeps counting regardless
+    def schedule(self):
+        if self.clock.running() and self.isVisible() and not self.isMinimized():
+            self.timer.start(self.refresh_interval())
+        else:
+            self.timer.stop()
+
+    def showEvent(self,event):
+        super().showEvent(event)
+        self.update_display()
+        self.schedule()
+
+    def hideEvent(self,event):
+        super().hideEvent(event)
+        self.schedule()
+
+    def changeEvent(self,event):
+        super().changeEvent(event)
+        if event.type()==QEvent.WindowStateChange:
+            self.update_display()
+            self.schedule()
 
     def reset(self):
-        self.time=QTime(0,0,0,0)
-        self.time_label.selectedText(self.format_time(self.time))
-
-    def format_time(self,time):
-        hours=time.hour()
-        minutes=time.minute()
-        seconds=time.second()
-        milliseconds=time.msec()//10
+        self.clock.reset()
+        self.update_display()
+
+    def format_time(self,elapsed_ms):
+        hours=elapsed_ms//3_600_000
+        minutes=elapsed_ms//60_000%60
+        seconds=elapsed_ms//1000%60
+        milliseconds=elapsed_ms%1000//10
         return f"{hours:02}:{minutes:02}:{seconds:02}:{milliseconds:02}"
 
+    # setText re-lays-out the 120px label, so only call it when the text changes
     def update_display(self):
-        self.time=self.time.addMSecs(10)
-        self.time_label.setText(self.format_time(self.time))
+        text=self.format_time(self.clock.elapsed_ms())
+        if text!=self.shown_text:
+            self.shown_text=text
+            self.time_label.setText(text)
 if __name__ == "__main__":
      app=QApplication(sys.argv)
      stopwatch=stopwatch()
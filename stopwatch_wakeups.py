@@ -0,0 +1,69 @@
+# Wakeups, label updates and CPU time per minute for the stopwatch in each mode.
+#   QT_QPA_PLATFORM=offscreen python stopwatch_wakeups.py --seconds 10
+# "tick10" is the old behaviour: a 10 ms QTimer calling setText on every tick.
+import argparse
+import importlib.util
+import os
+import time
+from PyQt5.QtCore import QEventLoop,QTimer
+from PyQt5.QtWidgets import QApplication
+
+HERE=os.path.dirname(os.path.abspath(__file__))
+MODES=("tick10","visible","minimized","hidden")
+
+def load_stopwatch():
+    spec=importlib.util.spec_from_file_location("stopwatch_app",os.path.join(HERE,"STOPWATCH PROJECT FINAL SEM.py"))
+    module=importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_for(seconds):
+    loop=QEventLoop()
+    QTimer.singleShot(int(seconds*1000),loop.quit)
+    loop.exec_()
+
+def measure(module,mode,seconds):
+    sw=module.stopwatch()
+    counts={"wakeups":0,"set_text":0}
+    label_set_text=sw.time_label.setText
+    def counted_set_text(text):
+        counts["set_text"]+=1
+        label_set_text(text)
+    sw.time_label.setText=counted_set_text
+    if mode=="tick10":
+        legacy=QTimer(sw)
+        legacy.timeout.connect(lambda:sw.time_label.setText(sw.format_time(sw.clock.elapsed_ms())))
+        legacy.timeout.connect(lambda:counts.__setitem__("wakeups",counts["wakeups"]+1))
+        sw.show()
+        sw.clock.start()
+        legacy.start(10)
+    else:
+        sw.timer.timeout.connect(lambda:counts.__setitem__("wakeups",counts["wakeups"]+1))
+        if mode=="visible":
+            sw.show()
+        elif mode=="minimized":
+            sw.showMinimized()
+        sw.start()
+    QApplication.processEvents()
+    counts["wakeups"]=counts["set_text"]=0
+    cpu=time.process_time()
+    run_for(seconds)
+    cpu=time.process_time()-cpu
+    sw.close()
+    per_minute=60/seconds
+    return counts["wakeups"]*per_minute,counts["set_text"]*per_minute,cpu*per_minute
+
+def main():
+    parser=argparse.ArgumentParser()
+    parser.add_argument("--seconds",type=float,default=10)
+    parser.add_argument("--modes",default=",".join(MODES))
+    args=parser.parse_args()
+    app=QApplication([])
+    module=load_stopwatch()
+    print(f"{'mode':<10} {'wakeups/min':>12} {'setText/min':>12} {'cpu s/min':>10}")
+    for mode in args.modes.split(","):
+        wakeups,set_text,cpu=measure(module,mode,args.seconds)
+        print(f"{mode:<10} {wakeups:>12.0f} {set_text:>12.0f} {cpu:>10.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Drift check for the stopwatch clock: ticks arrive late and irregularly, the
+# elapsed time must still be exactly the running time of the fake clock.
+#   python -m pytest -q test_stopwatch.py
+import importlib.util
+import os
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+HERE=os.path.dirname(os.path.abspath(__file__))
+
+def load_stopwatch():
+    spec=importlib.util.spec_from_file_location("stopwatch_app",os.path.join(HERE,"STOPWATCH PROJECT FINAL SEM.py"))
+    module=importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class fake_clock:
+    def __init__(self):
+        self.ns=0
+
+    def __call__(self):
+        return self.ns
+
+    def advance_ms(self,ms):
+        self.ns+=ms*1_000_000
+
+def test_delayed_ticks_and_stop_start_do_not_drift():
+    now=fake_clock()
+    clock=load_stopwatch().elapsed_clock(now=now)
+    clock.start()
+    # a 10 ms timer that fires late, with one long stall (window dragged, machine busy)
+    for delay in [10,13,27,10,10,250,11,19]:
+        now.advance_ms(delay)
+        clock.elapsed_ms()
+    assert clock.elapsed_ms()==350
+    clock.stop()
+    now.advance_ms(5000)
+    assert clock.elapsed_ms()==350
+    clock.start()
+    clock.start()
+    for _ in range(1000):
+        now.advance_ms(17)
+    assert clock.elapsed_ms()==350+17_000
+    clock.stop()
+    clock.stop()
+    assert clock.elapsed_ms()==17_350
+
+def test_reset_keeps_running_state():
+    now=fake_clock()
+    clock=load_stopwatch().elapsed_clock(now=now)
+    clock.start()
+    now.advance_ms(1234)
+    clock.reset()
+    assert clock.elapsed_ms()==0
+    now.advance_ms(66)
+    assert clock.elapsed_ms()==66
+    clock.stop()
+    clock.reset()
+    now.advance_ms(100)
+    assert clock.elapsed_ms()==0
+
+def test_sub_millisecond_remainders_are_not_lost():
+    now=fake_clock()
+    clock=load_stopwatch().elapsed_clock(now=now)
+    # 1000 runs of 1.5 ms: truncating each run to whole ms would show 1000 ms
+    for _ in range(1000):
+        clock.start()
+        now.ns+=1_500_000
+        clock.stop()
+    assert clock.elapsed_ms()==1500